@@ -173,26 +173,28 @@ _STD_CSV_COLUMNS = [
     "outputfile.md5",
     "outputfile.base64",
 ]
+# Maps standard column names to their sort key for constant time lookup.
+_STD_CSV_COLUMN_KEYS = {name: str(index) for index, name in enumerate(_STD_CSV_COLUMNS)}
 
 
 def _format_metadata_value(v):
     """Formats metadata value to a human readable unicode string."""
     if isinstance(v, (list, tuple)):
-        result = u""
+        lines = []
         for j in v:
             if not isinstance(j, (bytes, str)):
-                result += u"{}\n".format(u", ".join(map(convert_to_unicode, j)))
+                lines.append(u", ".join(map(convert_to_unicode, j)))
             else:
-                result += u"{}\n".format(convert_to_unicode(j))
-        return result.rstrip()
+                lines.append(convert_to_unicode(j))
+        return u"\n".join(lines).rstrip()
     elif isinstance(v, dict):
-        result = u""
+        lines = []
         for field, value in six.iteritems(v):
             if isinstance(value, (list, tuple)):
                 value = u"[{}]".format(u", ".join(value))
 
-            result += u"{}: {}\n".format(field, value)
-        return result.rstrip()
+            lines.append(u"{}: {}".format(field, value))
+        return u"\n".join(lines).rstrip()
     else:
         return convert_to_unicode(v)
 
@@ -238,7 +240,7 @@ def _write_csv(input_files, results, csv_path=None):
     # Sort columns, but with PREFIX_COLUMNS showing up first.
     column_names = set(itertools.chain(*(metadata.keys() for metadata in results)))
     column_names = sorted(
-        column_names, key=lambda x: str(_STD_CSV_COLUMNS.index(x)) if x in _STD_CSV_COLUMNS else str(x)
+        column_names, key=lambda x: _STD_CSV_COLUMN_KEYS.get(x, str(x))
     )
 
     # Reformat metadata and write to CSV
@@ -1,5 +1,7 @@
 """Stores default configuration values."""
 
+import functools
+import json
 import logging
 import os
 import pathlib
@@ -11,11 +13,31 @@ from ruamel.yaml.scanner import ScannerError
 
 from mwcp.exceptions import ConfigError
 
+try:
+    import orjson
+except ImportError:
+    # orjson support is optional.
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 yaml = YAML()
 
 
+@functools.lru_cache(maxsize=4)
+def _load_fields(path: str, mtime: float) -> dict:
+    """
+    Loads the legacy fields.json file.
+    Results are cached by path and modification time, so the file is only re-parsed if it changes.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    # Use faster orjson parser if available.
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class Config(dict):
 
     CONFIG_FILE_NAME = "config.yml"
@@ -39,6 +61,15 @@ class Config(dict):
         super().clear()
         self.__init__()
 
+    @property
+    def fields(self) -> dict:
+        """
+        The parsed contents of fields.json.
+        NOTE: This dictionary is shared and must not be modified.
+        """
+        fields_path = self["FIELDS_PATH"]
+        return _load_fields(fields_path, os.path.getmtime(fields_path))
+
     @property
     def user_config_dir(self) -> pathlib.Path:
         cfg_dir = self.USER_CONFIG_DIR
@@ -163,9 +163,9 @@ class Dispatcher(object):
             file_object.parent = parent
             if parent:
                 parent.children.append(file_object)
-                logger.info(f"{parent.name} dispatched residual file: {file_object.name}")
+                logger.info("%s dispatched residual file: %s", parent.name, file_object.name)
                 if file_object.description:
-                    logger.info(f"File {file_object.name} described as {file_object.description}")
+                    logger.info("File %s described as %s", file_object.name, file_object.description)
 
         self._fifo_buffer.appendleft(file_object)
 
@@ -178,7 +178,7 @@ class Dispatcher(object):
         :yields: Identified Parser class or another Dispatcher that can be run
         """
         for parser in self.parsers:
-            logger.debug(u"Identifying {} with {!r}.".format(file_object.name, parser))
+            logger.debug("Identifying %s with %r.", file_object.name, parser)
 
             # First see if result has been cached.
             key = (parser, file_object.md5)
@@ -242,17 +242,17 @@ class Dispatcher(object):
             if isinstance(parser, Dispatcher):
                 # Parser is a group, change wording
                 logger.info(
-                    f"File {file_object.file_name} was misidentified with {parser.DESCRIPTION} parser, due to: "
-                    f"({exception}) Trying other parsers..."
+                    "File %s was misidentified with %s parser, due to: (%s) Trying other parsers...",
+                    file_object.file_name, parser.DESCRIPTION, exception
                 )
             else:
                 logger.info(
-                    f"File {file_object.file_name} was misidentified as {parser.DESCRIPTION}, due to: "
-                    f"({exception}) Trying other parsers..."
+                    "File %s was misidentified as %s, due to: (%s) Trying other parsers...",
+                    file_object.file_name, parser.DESCRIPTION, exception
                 )
             raise
         except Exception:
-            logger.exception(u"{} dispatch parser failed".format(parser.name))
+            logger.exception("%s dispatch parser failed", parser.name)
 
     def parse(self, file_object: FileObject, report: Report, *run_args, dispatcher: "Dispatcher" = None):
         """
@@ -286,7 +286,7 @@ class Dispatcher(object):
                 # (This also helps with cyclic loops)
                 # FIXME: Disabled until we can fix bug with greedy parsers.
                 if file_object.md5 in report.parsed_files and False:
-                    logger.info(f"File {file_object.name} has already been parsed. Ignoring...")
+                    logger.info("File %s has already been parsed. Ignoring...", file_object.name)
                     # Copy file description from the already parsed version and mark as duplicate.
                     parsed_file = report.parsed_files[file_object.md5]
                     file_object.description = parsed_file.description
@@ -297,10 +297,10 @@ class Dispatcher(object):
                 for parser, _run_args in self._identify_parsers(file_object):
                     if isinstance(parser, Dispatcher):
                         # Parser is a group, change wording
-                        logger.info(f"File {file_object.name} identified with {parser.DESCRIPTION} parser.")
+                        logger.info("File %s identified with %s parser.", file_object.name, parser.DESCRIPTION)
                     else:
-                        logger.info(f"File {file_object.name} identified as {parser.DESCRIPTION}.")
-                    logger.debug(f"{file_object.name} identified with {parser!r}")
+                        logger.info("File %s identified as %s.", file_object.name, parser.DESCRIPTION)
+                    logger.debug("%s identified with %r", file_object.name, parser)
 
                     try:
                         self._parse(file_object, parser, report, *_run_args)
@@ -328,7 +328,7 @@ class Dispatcher(object):
                 # If no parsers match and developer didn't set a description,
                 # mark as unidentified file and run default.
                 if not file_object.description:
-                    logger.info(f"Supplied file {file_object.name} was not identified.")
+                    logger.info("Supplied file %s was not identified.", file_object.name)
                     if self.default:
                         try:
                             self._parse(file_object, self.default, report)
@@ -4,7 +4,6 @@ Implements FileObject class used to provide an interface for the file being pars
 from __future__ import annotations
 import contextlib
 import datetime
-import hashlib
 import io
 import logging
 import os
@@ -329,6 +328,16 @@ class FileObject(object):
             parent = parent.parent
         return reversed(history)
 
+    def _compute_hashes(self):
+        """
+        Computes all hashes of the file in a single pass over the data.
+        (All of them end up being needed once the file is reported.)
+        """
+        hashes = metadata.hash_data(self.data)
+        self._md5 = hashes["md5"]
+        self._sha1 = hashes["sha1"]
+        self._sha256 = hashes["sha256"]
+
     @property
     def md5(self):
         """
@@ -336,7 +345,7 @@ class FileObject(object):
         :return: hash of the file as a hex string
         """
         if not self._md5:
-            self._md5 = hashlib.md5(self.data).hexdigest()
+            self._compute_hashes()
         return self._md5
 
     @property
@@ -346,7 +355,7 @@ class FileObject(object):
         :return: hash of the file as a hex string
         """
         if not self._sha1:
-            self._sha1 = hashlib.sha1(self.data).hexdigest()
+            self._compute_hashes()
         return self._sha1
 
     @property
@@ -356,7 +365,7 @@ class FileObject(object):
         :return: hash of the file as a hex string
         """
         if not self._sha256:
-            self._sha256 = hashlib.sha256(self.data).hexdigest()
+            self._compute_hashes()
         return self._sha256
 
     @property
@@ -54,6 +54,33 @@ cattr.register_unstructure_hook(IntEnum, lambda d: None if d is None else d.name
 T = TypeVar("T")
 
 
+# Precompiled patterns used during element construction and validation.
+_DRIVE_LETTER_RE = re.compile(r"^[A-Z]:\\")
+_URL_RE = re.compile(
+    r"((?P<app_protocol>[a-z\.\-+]{1,40})://)?(?P<address>\[?[^/]+\]?)"
+    r"(?P<path>/[^?]+)?(?P<query>.*)",
+    flags=re.IGNORECASE
+)
+_HEX_CHARS = "0123456789abcdefABCDEF"
+
+
+def hash_data(data: bytes, chunk_size: int = 1 << 20) -> Dict[str, str]:
+    """
+    Computes the md5, sha1, and sha256 hashes of the given data in a single pass.
+    Data is fed to all hashers one chunk at a time, so each chunk is only pulled into cache once.
+    """
+    md5 = hashlib.md5()
+    sha1 = hashlib.sha1()
+    sha256 = hashlib.sha256()
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        chunk = view[offset:offset + chunk_size]
+        md5.update(chunk)
+        sha1.update(chunk)
+        sha256.update(chunk)
+    return dict(md5=md5.hexdigest(), sha1=sha1.hexdigest(), sha256=sha256.hexdigest())
+
+
 def _cast(value: Any, type_: Type[T]) -> T:
     """
     Casts given value to the given type.
@@ -121,9 +148,13 @@ def _auto_convert(cls, fields):
     return new_fields
 
 
+_CAMEL_WORD_RE = re.compile("(.)([A-Z][a-z]+)")
+_CAMEL_BOUNDARY_RE = re.compile("([a-z0-9])([A-Z])")
+
+
 def _camel_to_snake(name):
-    name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
+    name = _CAMEL_WORD_RE.sub(r"\1_\2", name)
+    return _CAMEL_BOUNDARY_RE.sub(r"\1_\2", name).lower()
 
 
 def _strip_null(d: dict) -> dict:
@@ -510,7 +541,7 @@ class Path2(Metadata):
     def __attrs_post_init__(self):
         # If posix wasn't provided, determine this based on presence of drive letter or separator.
         if self.posix is None and (self.path.count("\\") or self.path.count("/")):
-            self.posix = not (re.match("^[A-Z]:\\\\", self.path) or self.path.count("\\") > self.path.count("/"))
+            self.posix = not (_DRIVE_LETTER_RE.match(self.path) or self.path.count("\\") > self.path.count("/"))
 
     @classmethod
     def _type(cls):
@@ -1148,12 +1179,6 @@ class URL2(Metadata):
     def _type(cls):
         return "url"
 
-    _URL_RE = re.compile(
-        r"((?P<app_protocol>[a-z\.\-+]{1,40})://)?(?P<address>\[?[^/]+\]?)"
-        r"(?P<path>/[^?]+)?(?P<query>.*)",
-        flags=re.IGNORECASE
-    )
-
     def __attrs_post_init__(self):
         self._processed = False  # prevent infinite loop.
         # Hidden fields for reporting later.
@@ -1164,7 +1189,7 @@ class URL2(Metadata):
             self._parse_url()
 
     def _parse_url(self):
-        match = self._URL_RE.match(self.url)
+        match = _URL_RE.match(self.url)
         if not match:
             raise ValidationError(f"Error parsing as url: {self.url}")
 
@@ -2634,8 +2659,10 @@ class Service(Metadata):
         # not guaranteed to be reliable
         # TODO: This is here just to keep legacy logic. Determine if this is still appropriate when we remove
         #   deprecations.
-        if self.image and ".exe" in self.image:
-            report.add(FilePath(self.image[:self.image.find(".exe") + 4]))
+        if self.image:
+            index = self.image.find(".exe")
+            if index != -1:
+                report.add(FilePath(self.image[:index + 4]))
         # TODO: doing this over setting dll as a Path type so we can set it as a "FilePath"
         if self.dll:
             report.add(FilePath(self.dll))
@@ -2734,11 +2761,10 @@ class SSLCertSHA1(Metadata):
         "pattern": "^[0-9a-fA-F]{40}$",
     }})
 
-    _SHA1_RE = re.compile("[0-9a-fA-F]{40}")
-
     @value.validator
     def _validate(self, attribute, value):
-        if not self._SHA1_RE.match(value):
+        # str.strip() removes every character if the value is entirely hex.
+        if len(value) != 40 or value.strip(_HEX_CHARS):
             raise ValidationError(f"Invalid SHA1 hash found: {value!r}")
 
     def as_stix(self, base_object, fixed_timestamp=None) -> STIXResult:
@@ -2819,13 +2845,11 @@ class File(Metadata):
     derivation: str = None
 
     def __attrs_post_init__(self):
-        if self.data is not None:
-            if not self.md5:
-                self.md5 = hashlib.md5(self.data).hexdigest()
-            if not self.sha1:
-                self.sha1 = hashlib.sha1(self.data).hexdigest()
-            if not self.sha256:
-                self.sha256 = hashlib.sha256(self.data).hexdigest()
+        if self.data is not None and not (self.md5 and self.sha1 and self.sha256):
+            hashes = hash_data(self.data)
+            self.md5 = self.md5 or hashes["md5"]
+            self.sha1 = self.sha1 or hashes["sha1"]
+            self.sha256 = self.sha256 or hashes["sha256"]
 
     # TODO: Add validation for hashes.
 
@@ -3,6 +3,7 @@ Interface for Report class.
 """
 import base64
 import collections
+import concurrent.futures
 import io
 import json
 import logging
@@ -26,6 +27,8 @@ from mwcp.utils.stringutils import convert_to_unicode, sanitize_filename
 
 logger = logging.getLogger(__name__)
 
+_HEX_ALPHA_RE = re.compile("[A-Fa-f]")
+
 
 # Maps legacy field names to their metadata.Element or helper function.
 METADATA_MAP = {
@@ -97,6 +100,16 @@ class ReportLogHandler(logging.Handler):
             report._logs.append(LogRecord(report._current_file, record.levelno, message))
 
 
+def _write_bytes(full_path: pathlib.Path, data: bytes) -> Optional[Exception]:
+    """
+    Writes the given data to the given path, returning the raised exception on failure.
+    """
+    try:
+        full_path.write_bytes(data)
+    except Exception as e:
+        return e
+
+
 T = TypeVar("T")
 
 
@@ -122,6 +135,9 @@ class Report:
         separate strings report.
     """
 
+    # Maximum number of threads used to write out residual files.
+    _MAX_WRITE_WORKERS = 4
+
     def __init__(
             self,
             input_file: mwcp.FileObject = None,
@@ -161,10 +177,15 @@ class Report:
         self._logs: List[LogRecord] = []
         # Holds metadata per file.
         self._metadata = collections.defaultdict(list)
+        # Holds the same metadata bucketed per (file, element type) for faster deduplication.
+        # (Elements of different types are never equal, so only same typed elements need to be compared.)
+        self._metadata_index = collections.defaultdict(list)
         self._current_file = input_file  # type: FileObject
         self._history = [input_file]  # type: List[FileObject]
         self.parsed_files = {}
         self.finalized = False
+        # Caches hashes of data passed to output_file(), keyed by object identity.
+        self._file_hashes = {}
 
         # Setup a log handler to add errors and debug messages to the report.
         if include_logs:
@@ -214,8 +235,8 @@ class Report:
             "Usage of the fields attribute is deprecated. ",
             DeprecationWarning
         )
-        with open(config.get("FIELDS_PATH"), "rb") as f:
-            return json.load(f)
+        # Copy to prevent modifying the cached fields.
+        return deepcopy(config.fields)
 
     @property
     def external_knowledge(self) -> dict:
@@ -514,13 +535,21 @@ class Report:
         """
         input_file = source or self.input_file
         metadata_entries = self.get(source=source)
+        # Collect logs and errors in a single pass.
+        logs = []
+        errors = []
+        for record in self._logs:
+            if not source or record.source == source:
+                logs.append(record.message)
+                if record.level > logging.WARNING:
+                    errors.append(record.message)
         report_model = metadata.Report(
             input_file=metadata.File.from_file_object(input_file) if input_file else None,
             parser=(input_file.parser and input_file.parser.name) if source else self.parser,
             recursive=self.recursive,
             external_knowledge=self.external_knowledge,
-            errors=self.get_logs(source, errors_only=True),
-            logs=self.get_logs(source),
+            errors=errors,
+            logs=logs,
             metadata=deepcopy(metadata_entries),
         ).add_tag(*self.tags)
         report_model.validate()
@@ -555,9 +584,10 @@ class Report:
         """
         Returns a list of report models split between each source file.
         """
+        history_order = {file_object: index for index, file_object in enumerate(self._history)}
         return [
             self._build_report_model(source=file_object)
-            for file_object in sorted(self._metadata.keys(), key=lambda fo: self._history.index(fo))
+            for file_object in sorted(self._metadata.keys(), key=history_order.__getitem__)
         ]
 
     def as_dict(self) -> dict:
@@ -763,7 +793,7 @@ class Report:
         # Convert value for fields that expect hex strings.
         if (isinstance(value, str)
                 and field_name in ("rsa_private_key", "rsa_public_key")
-                and (value.startswith("0x") or re.search("[A-Fa-f]", value))
+                and (value.startswith("0x") or _HEX_ALPHA_RE.search(value))
         ):
             return int(value, 16)
 
@@ -784,10 +814,36 @@ class Report:
         if self.finalized:
             raise RuntimeError("Report has already been finalized. Metadata can no longer be added.")
 
-        metadata_list = self._metadata[self._current_file]
-        if element not in metadata_list:
+        self._add(self._current_file, element)
+
+    def add_many(self, elements: Iterable[Metadata]):
+        """
+        Report multiple metadata items at once.
+        This is equivalent to calling add() on each element, but the report state is only checked once.
+
+        e.g.
+            report.add_many(metadata.URL(url) for url in urls)
+
+        :param elements: metadata.Element objects to add.
+        :raises mwcp.ValidationError: If a given element is not valid.
+        """
+        if self.finalized:
+            raise RuntimeError("Report has already been finalized. Metadata can no longer be added.")
+
+        current_file = self._current_file
+        for element in elements:
+            self._add(current_file, element)
+
+    def _add(self, source: FileObject, element: Metadata):
+        """
+        Adds given element under the given source file if it hasn't already been added.
+        """
+        metadata_list = self._metadata[source]
+        same_type = self._metadata_index[source, type(element)]
+        if element not in same_type:
             element.validate()
             metadata_list.append(element)
+            same_type.append(element)
             element.post_processing(self)
 
     def remove(self, element: Metadata):
@@ -800,6 +856,7 @@ class Report:
         for source, entries in self._metadata.items():
             if element in entries:
                 entries.remove(element)
+                self._metadata_index[source, type(element)].remove(element)
 
     def set_file(self, file_object: FileObject):
         """
@@ -830,7 +887,7 @@ class Report:
 
         field_name = convert_to_unicode(field_name_or_element)
         if value is None or all(not _value for _value in value):
-            logger.debug(f"No values provided for {field_name}, skipping")
+            logger.debug("No values provided for %s, skipping", field_name)
             return
 
         if field_name == "debug":
@@ -852,36 +909,116 @@ class Report:
             "output_file() is deprecated. Please add a metadata.File object to add() instead.",
             DeprecationWarning
         )
-        residual_file = metadata.File(name=filename, description=description, data=data)
+        residual_file = metadata.File(
+            name=filename, description=description, data=data, **self._get_hashes(data)
+        )
         self.add(residual_file)
         # In order to be backwards compatible, we have to write out the file here, so we can
         # return a file path.
         return self._write_file(residual_file)
 
-    def _write_file(self, file: File) -> Optional[str]:
+    def _get_hashes(self, data: bytes) -> dict:
         """
-        Writes out the given File metadata object and returns the file path to the written file
-        or None on failure.
+        Obtains the md5, sha1, and sha256 hashes for the given data.
+        Hashes are cached by identity, so outputting the same data multiple times
+        (e.g. under different file names) doesn't require rehashing it.
         """
-        if not self._write_output_files:
-            return
+        # Only immutable bytes can be safely cached by identity.
+        if type(data) is not bytes:
+            return {}
+        key = (id(data), len(data))
+        # A reference to the data is kept with the hashes, which prevents the id from being reused.
+        cached = self._file_hashes.get(key)
+        if cached and cached[0] is data:
+            return cached[1]
+        hashes = metadata.hash_data(data)
+        self._file_hashes[key] = (data, hashes)
+        return hashes
 
+    def _get_output_path(self, file: File) -> pathlib.Path:
+        """
+        Obtains the path the given File metadata object should be written out to.
+        """
         # Create a safe filename that won't have any name collisions.
         safe_filename = sanitize_filename(file.name)
         if self._prefix_output_files:
             safe_filename = f"{file.md5[:5]}_{safe_filename}"
-        full_path = self._output_directory / safe_filename
+        return self._output_directory / safe_filename
 
-        try:
-            # TODO: Should we attach the real file path?
-            full_path.write_bytes(file.data)
-            logger.debug(f"Output file: {full_path}")
-            full_path = str(full_path)
-            file.file_path = full_path
-            return full_path
-        except Exception as e:
-            logger.error(f"Failed to write output file {full_path} with error: {e}")
+    def _is_written(self, file: File, full_path: pathlib.Path) -> bool:
+        """
+        Whether the given File has already been written out to the given path. (e.g. from output_file())
+        """
+        return file.file_path == str(full_path) and full_path.exists()
+
+    def _record_write(self, file: File, full_path: pathlib.Path, error: Optional[Exception]) -> Optional[str]:
+        """
+        Records the result of writing out the given File and returns the file path to the written file
+        or None on failure.
+        """
+        if error:
+            logger.error("Failed to write output file %s with error: %s", full_path, error)
             return
+        # TODO: Should we attach the real file path?
+        logger.debug("Output file: %s", full_path)
+        full_path = str(full_path)
+        file.file_path = full_path
+        return full_path
+
+    def _write_file(self, file: File) -> Optional[str]:
+        """
+        Writes out the given File metadata object and returns the file path to the written file
+        or None on failure.
+        """
+        if not self._write_output_files:
+            return
+
+        full_path = self._get_output_path(file)
+        return self._record_write(file, full_path, _write_bytes(full_path, file.data))
+
+    def _write_files(self, files: Iterable[File]):
+        """
+        Writes out the given File metadata objects concurrently.
+        Writes to different paths are independent, so overlapping them hides the file system latency.
+        """
+        files_to_write = []
+        # Writing the files in order results in the last file mapped to each path being kept.
+        # Therefore, only that file needs to be written, unless it was already written out by output_file().
+        last_files = {}
+        for file in files:
+            full_path = self._get_output_path(file)
+            written = self._is_written(file, full_path)
+            last_files[full_path] = (file, written)
+            if not written:
+                files_to_write.append((file, full_path))
+        data_to_write = {
+            full_path: file.data
+            for full_path, (file, written) in last_files.items()
+            if not written
+        }
+        if not files_to_write:
+            return
+
+        if len(data_to_write) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self._MAX_WRITE_WORKERS) as executor:
+                futures = {
+                    full_path: executor.submit(_write_bytes, full_path, data)
+                    for full_path, data in data_to_write.items()
+                }
+            errors = {full_path: future.result() for full_path, future in futures.items()}
+        else:
+            errors = {full_path: _write_bytes(full_path, data) for full_path, data in data_to_write.items()}
+
+        # Record results in order, so logs stay deterministic.
+        failed_paths = set()
+        for file, full_path in files_to_write:
+            error = errors.get(full_path)
+            if error:
+                # Only report a failed write once, even if multiple files were mapped to the path.
+                if full_path in failed_paths:
+                    continue
+                failed_paths.add(full_path)
+            self._record_write(file, full_path, error)
 
     def finalize(self):
         """
@@ -912,8 +1049,7 @@ class Report:
         # TODO: move this to post_processing of File?
         # Write out residual files to file system if requested.
         if self._write_output_files:
-            for residual_file in self.iter(metadata.File):
-                self._write_file(residual_file)
+            self._write_files(self.iter(metadata.File))
 
         # Remove log handler.
         if self._log_handler:
@@ -964,14 +1100,17 @@ class Report:
         else:
             metadata_lists = self._metadata.values()
 
-        yielded = []
+        # Yielded elements bucketed by type.
+        yielded = collections.defaultdict(list)
         for metadata_list in metadata_lists:
             for element in metadata_list:
                 for _element in element.elements():
                     if not element_type or isinstance(_element, element_type):
-                        # Metadata elements are not hashable, so we need to check equality of each.
-                        if not any(_element == yielded_element for yielded_element in yielded):
-                            yielded.append(_element)
+                        # Metadata elements are not hashable, so we need to check equality of each
+                        # (but only against elements of the same type).
+                        same_type = yielded[type(_element)]
+                        if not any(_element == yielded_element for yielded_element in same_type):
+                            same_type.append(_element)
                             yield _element
 
     def get(
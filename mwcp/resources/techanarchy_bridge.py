@@ -105,7 +105,7 @@ def map_ta_domain_fields(data, reporter):
                             # CyberGate has a separator character in the field
                             # remove it here
                             data['Port'] = data['Port'].rstrip('|').strip('|')
-                            for port in data['Port']:
+                            if data['Port']:
                                 reporter.add_metadata("c2_socketaddress", [
                                     addport, data['Port'], 'tcp'])
                         if 'Port1' in data:
@@ -388,7 +388,7 @@ def run_decoder(parser, script, scriptname=""):
         else:
             command = [script, parser.file_object.file_path, outputfile]
 
-        parser.logger.info("Running %s using %s" % (scriptname, " ".join(command)))
+        parser.logger.info("Running %s using %s", scriptname, " ".join(command))
 
         popen_object = subprocess.Popen(
             command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
@@ -403,15 +403,14 @@ def run_decoder(parser, script, scriptname=""):
             parser.logger.warning(line.rstrip())
 
         if popen_object.returncode != 0:
-            parser.logger.error("Error running script. Return code: %i" %
-                           popen_object.returncode)
+            parser.logger.error("Error running script. Return code: %i", popen_object.returncode)
 
         configlist = []
         try:
             with open(outputfile, "rb") as f:
                 configlist = [line.rstrip("\n\r") for line in f]
         except Exception as e:
-            parser.logger.error("Error reading script output file: %s" % str(e))
+            parser.logger.error("Error reading script output file: %s", e)
 
     output_re = re.compile(TECHANARCHY_OUTPUT_RE)
     output_data = {}
@@ -424,10 +423,10 @@ def run_decoder(parser, script, scriptname=""):
             parser.reporter.add_metadata("other", {key: value})
             if value:
                 if key in output_data:
-                    parser.logger.warning("collision on output key: %s" % key)
+                    parser.logger.warning("collision on output key: %s", key)
                 output_data[key] = value
         else:
-            parser.logger.warning("Could not parse output item: %s" % item)
+            parser.logger.warning("Could not parse output item: %s", item)
 
     data = output_data
 
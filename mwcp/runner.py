@@ -2,10 +2,10 @@
 Interface for Runner class.
 """
 from __future__ import annotations
-import contextlib
 import logging
 import pathlib
 import re
+import sys
 import weakref
 from collections import deque
 from typing import TYPE_CHECKING, Union, Type, Tuple, Iterable
@@ -31,16 +31,16 @@ class OutputLogger:
     Redirects stdout to the logger.
     """
 
-    def __init__(self):
-        # noinspection PyTypeChecker
-        self._redirector = contextlib.redirect_stdout(self)
+    __slots__ = ("_orig_stdout",)
 
     def __enter__(self):
-        self._redirector.__enter__()
+        # Swap stdout directly instead of going through contextlib.redirect_stdout().
+        self._orig_stdout = sys.stdout
+        sys.stdout = self
         return self
 
     def __exit__(self, *args):
-        self._redirector.__exit__(*args)
+        sys.stdout = self._orig_stdout
 
     def write(self, message):
         logger.info(message)
@@ -60,14 +60,12 @@ class Runner:
 
     def _parse(self, input_file: FileObject, parsers: Iterable[Parser], report: Report):
         for parser in parsers:
-            logger.debug(f"Parsing {input_file.name} with {parser.name}")
+            logger.debug("Parsing %s with %s", input_file.name, parser.name)
             try:
                 parser.parse(input_file, report)
             except (Exception, SystemExit):
                 file_path = input_file.file_path if input_file._exists else input_file.md5
-                logger.exception(
-                    f"Error running parser {parser.name} on {file_path}"
-                )
+                logger.exception("Error running parser %s on %s", parser.name, file_path)
 
     def _generate_input_file(self, file_path: Union[str, pathlib.Path] = None, data: bytes = None) -> FileObject:
         if file_path:
@@ -164,14 +162,14 @@ class YaraRunner(Runner):
             if file_path.suffix in (".yara", ".yar"):
                 # Ignore rules files without any "mwcp" meta elements.
                 if not re.search("mwcp\s*=", file_path.read_text()):
-                    logger.debug(f"Ignoring rule file without 'mwcp' metadata: {file_path}")
+                    logger.debug("Ignoring rule file without 'mwcp' metadata: %s", file_path)
                     continue
 
                 try:
                     yara.compile(filepath=str(file_path))
                     rule_paths.append(file_path)
                 except yara.Error as e:
-                    logger.warning(f"[Skipping Rules] Failed to compile: {e}")
+                    logger.warning("[Skipping Rules] Failed to compile: %s", e)
 
         return yara.compile(filepaths={path.name: str(path) for path in rule_paths})
 
@@ -190,23 +188,23 @@ class YaraRunner(Runner):
 
         # Otherwise, run YARA to detect which parsers to run.
         seen = set()
-        logger.info(f"Attempting to YARA match {file_object.name}")
+        logger.info("Attempting to YARA match %s", file_object.name)
         matched = False
         for match in self._rules.match(data=file_object.data):
-            logger.debug(f"Matched {file_object.name} with YARA rule: {match.rule}")
+            logger.debug("Matched %s with YARA rule: %s", file_object.name, match.rule)
             if "mwcp" in match.meta:
                 mwcp_meta = match.meta["mwcp"]
-                logger.debug(f"Mapped {file_object.name}: {mwcp_meta}")
+                logger.debug("Mapped %s: %s", file_object.name, mwcp_meta)
                 parser_names = [name.strip() for name in mwcp_meta.split(",")]
                 for name in parser_names:
                     for source, parser in iter_parsers(name):
                         if (source.name, parser.name) not in seen:
                             seen.add((source.name, parser.name))
-                            logger.info(f"Matched {file_object.name} with {parser.name} parser.")
+                            logger.info("Matched %s with %s parser.", file_object.name, parser.name)
                             matched = True
                             yield parser
         if not matched:
-            logger.info(f"Found no YARA matches for {file_object.name}")
+            logger.info("Found no YARA matches for %s", file_object.name)
 
     def _collect_unidentified(self, report: Report) -> Iterable[FileObject]:
         """Collects new unidentified files since the last time this function was run."""
@@ -404,10 +404,8 @@ class TestCase(object):
         except:
             raise Exception("Failed to convert field name '{}' to unicode.".format(field_name))
 
-        # Stolen from Reporter/Runner.
         # TODO: Look into refactoring to use pytest entirely?
-        with open(config.get("FIELDS_PATH"), "rb") as f:
-            fields = json.load(f)
+        fields = config.fields
 
         try:
             field_type = fields[field_name_u]["type"]
@@ -424,18 +422,11 @@ class TestCase(object):
 
         # Now compare results based on field type (see "fields.json" for more
         # details)
-        if field_type == "listofstrings":
-            comparer = ListOfStringsComparer(field_name_u)
-            comparer.compare(value_a, value_b)
-        elif field_type == "listofstringtuples":
-            comparer = ListOfStringTuplesComparer(field_name_u)
-            comparer.compare(value_a, value_b)
-        elif field_type == "dictofstrings":
-            comparer = DictOfStringsComparer(field_name_u)
-            comparer.compare(value_a, value_b)
-        else:
+        comparer_class = COMPARERS.get(field_type)
+        if comparer_class is None:
             raise Exception("Unhandled field type '{}' found for field name '{}'.".format(field_type, field_name))
-
+        comparer = comparer_class(field_name_u)
+        comparer.compare(value_a, value_b)
         return comparer
 
 
@@ -467,35 +458,40 @@ class TestResult(object):
         else:
             separator = ""
 
-            filtered_output = ""
+            parts = []
             passed = self.passed
             if passed and passed_tests:
-                filtered_output += "Parser Name = {}\n".format(self.parser)
+                parts.append("Parser Name = {}\n".format(self.parser))
                 if self.input_file_path and self.input_file_path != "N/A":
-                    filtered_output += "Input Filename = {}\n".format(self.input_file_path)
-                filtered_output += "Tests Passed = {}\n".format(self.passed)
+                    parts.append("Input Filename = {}\n".format(self.input_file_path))
+                parts.append("Tests Passed = {}\n".format(self.passed))
             elif not passed and failed_tests:
-                filtered_output += "Parser Name = {}\n".format(self.parser)
+                parts.append("Parser Name = {}\n".format(self.parser))
                 if self.input_file_path and self.input_file_path != "N/A":
-                    filtered_output += "Input Filename = {}\n".format(self.input_file_path)
-                filtered_output += "Tests Passed = {}\n".format(self.passed)
-                filtered_output += "Errors = {}".format("\n" if self.errors else "None\n")
+                    parts.append("Input Filename = {}\n".format(self.input_file_path))
+                parts.append("Tests Passed = {}\n".format(self.passed))
+                parts.append("Errors = {}".format("\n" if self.errors else "None\n"))
                 if self.errors:
                     for entry in self.errors:
-                        filtered_output += "\t{0}\n".format(entry)
-                filtered_output += "Debug Logs = {}".format("\n" if self.debug else "None\n")
+                        parts.append("\t{0}\n".format(entry))
+                parts.append("Debug Logs = {}".format("\n" if self.debug else "None\n"))
                 if self.debug:
                     for entry in self.debug:
-                        filtered_output += "\t{0}\n".format(entry)
+                        parts.append("\t{0}\n".format(entry))
                 if self.results:
-                    filtered_output += "Results =\n"
+                    parts.append("Results =\n")
                     for result in self.results:
                         if not result.passed:
-                            filtered_output += "{0}\n".format(result)
+                            parts.append("{0}\n".format(result))
 
-            if filtered_output:
-                filtered_output += "{0}\n".format(separator)
-                print(filtered_output.encode("ascii", "backslashreplace").decode())
+            if parts:
+                parts.append("{0}\n".format(separator))
+                filtered_output = "".join(parts)
+                # Escape non-ascii characters so output is safe for any console encoding.
+                # (Only needs the encode/decode round trip if something actually needs escaping.)
+                if not filtered_output.isascii():
+                    filtered_output = filtered_output.encode("ascii", "backslashreplace").decode()
+                print(filtered_output)
 
 
 ####################################################
@@ -537,18 +533,20 @@ class ResultComparer(object):
             tab = tabs * "\t"
             tab_1 = tab + "\t"
             tab_2 = tab_1 + "\t"
-            report = tab + "{}:\n".format(self.field)
-            report += tab_1 + "Passed: {}\n".format(self.passed)
+            parts = [
+                tab + "{}:\n".format(self.field),
+                tab_1 + "Passed: {}\n".format(self.passed),
+            ]
             if self.missing:
-                report += tab_1 + "Missing From New Results:\n"
+                parts.append(tab_1 + "Missing From New Results:\n")
                 for item in self.missing:
-                    report += tab_2 + "{}\n".format(convert_to_unicode(item))
+                    parts.append(tab_2 + "{}\n".format(convert_to_unicode(item)))
             if self.unexpected:
-                report += tab_1 + "Unexpected New Results:\n"
+                parts.append(tab_1 + "Unexpected New Results:\n")
                 for item in self.unexpected:
-                    report += tab_2 + "{}\n".format(convert_to_unicode(item))
+                    parts.append(tab_2 + "{}\n".format(convert_to_unicode(item)))
 
-            return report
+            return "".join(parts)
 
     def __bytes__(self):
         return self.get_report().encode("utf8")
@@ -618,6 +616,14 @@ class DictOfStringsComparer(ResultComparer):
                 self.unexpected.append(u"{}: {!r}".format(key, dict_new[key]))
 
 
+# Maps field types (as found in "fields.json") to their comparer.
+COMPARERS = {
+    "listofstrings": ListOfStringsComparer,
+    "listofstringtuples": ListOfStringTuplesComparer,
+    "dictofstrings": DictOfStringsComparer,
+}
+
+
 ####################################################
 # JSON encoders
 ####################################################
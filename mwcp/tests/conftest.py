@@ -157,6 +157,22 @@ def report():
     return mwcp.Report(input_file, "FooParser")
 
 
+@pytest.fixture
+def make_output_report(tmp_path):
+    """
+    Creates and returns a function to generate an empty report which writes output files
+    into a temporary directory.
+    """
+    import logging
+    logging.root.setLevel(logging.DEBUG)
+
+    def _make_output_report(**kwargs):
+        input_file = mwcp.FileObject(b"some data", file_path="C:/input_file.bin")
+        return mwcp.Report(input_file, "FooParser", output_directory=tmp_path, **kwargs)
+
+    return _make_output_report
+
+
 @pytest.fixture
 def metadata_items() -> List[Metadata]:
     """
@@ -0,0 +1,29 @@
+"""
+Tests configuration handling.
+"""
+import json
+import sys
+
+import pytest
+
+import mwcp
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fields(mocker, use_orjson):
+    """
+    Tests loading fields.json with and without the optional orjson parser.
+    """
+    config_module = sys.modules["mwcp.config"]
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        mocker.patch.object(config_module, "orjson", None)
+    config_module._load_fields.cache_clear()
+    fields = mwcp.config.fields
+
+    with open(mwcp.config["FIELDS_PATH"], "r") as fo:
+        expected = json.load(fo)
+    assert fields == expected
+    # Results should be cached until the file changes.
+    assert mwcp.config.fields is fields
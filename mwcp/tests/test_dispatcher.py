@@ -1,4 +1,5 @@
 """Tests the Dispatcher and FileObject functionality."""
+import hashlib
 import logging
 import os
 import pathlib
@@ -188,3 +189,19 @@ def test_file_object(tmpdir):
     assert len(residual_files) == 1
     assert residual_files[0].name == file_object.name
     assert residual_files[0].md5 == "fb843efb2ffec987db12e72ca75c9ea2"
+
+
+@pytest.mark.parametrize("attribute", ["md5", "sha1", "sha256"])
+def test_file_object_hashes(attribute):
+    """
+    Tests the FileObject hashes for data spanning multiple hashing chunks.
+    """
+    data = bytes(range(256)) * 5000 + b"tail"
+    assert len(data) > 1 << 20
+    file_object = mwcp.FileObject(data, output_file=False)
+
+    # Accessing any one hash should compute all of them correctly.
+    assert getattr(file_object, attribute) == getattr(hashlib, attribute)(data).hexdigest()
+    assert file_object.md5 == hashlib.md5(data).hexdigest()
+    assert file_object.sha1 == hashlib.sha1(data).hexdigest()
+    assert file_object.sha256 == hashlib.sha256(data).hexdigest()
@@ -133,3 +133,14 @@ SubParser:
     assert residual_files[1].name == "implant.txt"
     assert residual_files[1].description == "Unidentified file"
     assert residual_files[1].file_path == str(output_directory / "3e245_implant.txt")
+
+
+def test_cybergate_port_reported_once(mocker):
+    """
+    Tests bug where a CyberGate socket address was reported once per character of the port field.
+    """
+    from mwcp.resources import techanarchy_bridge
+
+    reporter = mocker.Mock()
+    techanarchy_bridge.map_ta_domain_fields({"Domain": "example.com|", "Port": "|8080|"}, reporter)
+    reporter.add_metadata.assert_called_once_with("c2_socketaddress", ["example.com", "8080", "tcp"])
@@ -245,3 +245,19 @@ def test_scheduled_task_from_xml():
             }
         ]
     }
+
+
+@pytest.mark.parametrize("value,valid", [
+    ("c29d79df9b5416fd416c31e57cd525dfc23a8f66", True),
+    ("C29D79DF9B5416FD416C31E57CD525DFC23A8F66", True),
+    ("c29d79df9b5416fd416c31e57cd525dfc23a8f6", False),
+    ("c29d79df9b5416fd416c31e57cd525dfc23a8f66a", False),
+    ("g29d79df9b5416fd416c31e57cd525dfc23a8f66", False),
+    ("", False),
+])
+def test_ssl_cert_sha1_validation(value, valid):
+    if valid:
+        assert metadata.SSLCertSHA1(value).value == value
+    else:
+        with pytest.raises(mwcp.ValidationError):
+            metadata.SSLCertSHA1(value)
@@ -129,3 +129,133 @@ def test_deduplication(report):
         metadata.Socket(address="example.com"),
         metadata.C2Address(address="example.com"),
     ]
+
+
+def test_output_file_hash_cache(report, mocker):
+    """
+    Tests that outputting the same data multiple times reuses the computed hashes.
+    """
+    hash_data = mocker.spy(mwcp.metadata, "hash_data")
+    data = b"residual data"
+    with report:
+        report.output_file(data, "first.bin")
+        report.output_file(data, "second.bin")
+        report.output_file(bytearray(b"other data"), "third.bin")
+
+    # Data is hashed once for the repeated bytes and once for the (uncached) bytearray.
+    assert hash_data.call_count == 2
+    files = report.get(metadata.File)
+    assert [file.name for file in files] == ["first.bin", "second.bin", "third.bin"]
+    assert files[0].md5 == files[1].md5 == "ae9bd1acdd46212cc459f9cedbd170e1"
+    assert files[2].md5 == metadata.File(data=b"other data").md5
+
+
+def test_output_file_written_once(tmp_path, mocker, make_output_report):
+    """
+    Tests that files written out by output_file() are not rewritten when the report is finalized.
+    """
+    write_bytes = mocker.spy(mwcp.report.pathlib.Path, "write_bytes")
+    report = make_output_report()
+    with report:
+        file_path = report.output_file(b"residual data", "res.bin")
+        report.add(metadata.File(name="other.bin", data=b"other data"))
+
+    assert write_bytes.call_count == 2
+    assert file_path == str(tmp_path / "ae9bd_res.bin")
+    assert (tmp_path / "ae9bd_res.bin").read_bytes() == b"residual data"
+    assert (tmp_path / "c7d68_other.bin").exists()
+
+
+def test_output_file_name_collision(tmp_path, make_output_report):
+    """
+    Tests that files written out by output_file() are still kept when a previously reported file
+    has the same name.
+    """
+    report = make_output_report(prefix_output_files=False)
+    with report:
+        report.add(metadata.File(name="x.bin", data=b"B"))
+        file_path = report.output_file(b"A", "x.bin")
+
+    assert file_path == str(tmp_path / "x.bin")
+    assert (tmp_path / "x.bin").read_bytes() == b"A"
+
+    # Files reported after output_file() should still overwrite it.
+    report = make_output_report(prefix_output_files=False)
+    with report:
+        report.output_file(b"A", "y.bin")
+        report.add(metadata.File(name="y.bin", data=b"B"))
+
+    assert (tmp_path / "y.bin").read_bytes() == b"B"
+
+
+def test_add_many(report):
+    """
+    Tests adding multiple metadata elements at once.
+    """
+    with report:
+        report.add_many(metadata.URL(url) for url in ["example1.com", "example2.com", "example1.com"])
+        report.add_many([metadata.Mutex("mutex"), metadata.Mutex("mutex")])
+    with pytest.raises(RuntimeError):
+        report.add_many([metadata.URL("example3.com")])
+
+    assert report.get() == [
+        metadata.URL("example1.com"),
+        metadata.Network(url=metadata.URL2(url="example1.com"), socket=metadata.Socket(address="example1.com")),
+        metadata.Socket(address="example1.com"),
+        metadata.URL("example2.com"),
+        metadata.Network(url=metadata.URL2(url="example2.com"), socket=metadata.Socket(address="example2.com")),
+        metadata.Socket(address="example2.com"),
+        metadata.Mutex("mutex"),
+    ]
+
+
+def test_write_output_files(tmp_path, make_output_report):
+    """
+    Tests writing out residual files when the report is finalized.
+    """
+    report = make_output_report(prefix_output_files=False)
+    with report:
+        for index in range(10):
+            report.add(metadata.File(name=f"file_{index}.bin", data=f"data {index}".encode()))
+        # Files with colliding names should result in the last one reported being written.
+        report.add(metadata.File(name="dup.bin", data=b"first"))
+        report.add(metadata.File(name="dup.bin", data=b"second"))
+
+    for index in range(10):
+        assert (tmp_path / f"file_{index}.bin").read_bytes() == f"data {index}".encode()
+    assert (tmp_path / "dup.bin").read_bytes() == b"second"
+    files = report.get(metadata.File)
+    assert all(file.file_path for file in files)
+    assert report.logs[-1] == f"[*] Output file: {tmp_path / 'dup.bin'}"
+
+
+def test_write_output_files_failure(tmp_path, mocker, make_output_report):
+    """
+    Tests a failed write of residual files is only reported once.
+    """
+    executor = mocker.spy(mwcp.report.concurrent.futures, "ThreadPoolExecutor")
+    mocker.patch.object(mwcp.report.pathlib.Path, "write_bytes", side_effect=OSError("disk full"))
+    report = make_output_report(prefix_output_files=False)
+    with report:
+        report.add(metadata.File(name="dup.bin", data=b"first"))
+        report.add(metadata.File(name="dup.bin", data=b"second"))
+
+    # A single path doesn't need a thread pool.
+    assert not executor.called
+    errors = report.errors
+    assert len(errors) == 1
+    assert errors[0] == f"[!] Failed to write output file {tmp_path / 'dup.bin'} with error: disk full"
+    assert not any(file.file_path for file in report.get(metadata.File))
+
+
+def test_log_message_frozen(report):
+    """
+    Tests that log messages reflect the arguments at the time of logging.
+    """
+    logger = logging.getLogger("test_report")
+    items = ["a"]
+    with report:
+        logger.info("found %s", items)
+        items.append("b")
+
+    assert report.logs == ["[+] found ['a']"]
@@ -125,9 +125,10 @@ class Member(construct.RawCopy):
             obj.docs = self.docs
 
             # Map ourselves to every byte we cover.
+            # (Using a local reference and a single setdefault() call avoids repeated lookups per byte.)
+            member_map = self._member_map
             for index in range(obj.offset1, obj.offset2):
-                self._member_map.setdefault(index, [])
-                self._member_map[index].append(obj)
+                member_map.setdefault(index, []).append(obj)
 
         return obj.value
 
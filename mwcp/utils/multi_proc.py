@@ -33,7 +33,7 @@ class TProcess(mp.Process):
 
     def run(self):
         logutil.setup_logging(queue=self.queue)
-        logger.debug("Setup logger in {}".format(mp.current_process().name))
+        logger.debug("Setup logger in %s", mp.current_process().name)
         super(TProcess, self).run()
 
 
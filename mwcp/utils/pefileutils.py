@@ -25,7 +25,7 @@ def obtain_pe(file_data):
     try:
         return pefile.PE(data=file_data)
     except pefile.PEFormatError as e:
-        logger.debug("A pefile.PE object on the file data could not be created: {}".format(e))
+        logger.debug("A pefile.PE object on the file data could not be created: %s", e)
         return None
 
 
@@ -17,6 +17,8 @@ def convert_to_unicode(input_value):
 
 
 VALID_FILENAME_CHARS = "-_.() {}{}".format(string.ascii_letters, string.digits).encode("ascii")
+# Complement of VALID_FILENAME_CHARS, used to strip invalid characters with bytes.translate()
+_INVALID_FILENAME_CHARS = bytes(c for c in range(256) if c not in VALID_FILENAME_CHARS)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -25,7 +27,7 @@ def sanitize_filename(filename: str) -> str:
     """
     filename = convert_to_unicode(filename)
     filename = unicodedata.normalize("NFKD", filename)  # convert accented characters
-    filename = convert_to_unicode(bytes(c for c in filename.encode("ascii", "ignore") if c in VALID_FILENAME_CHARS))
+    filename = filename.encode("ascii", "ignore").translate(None, _INVALID_FILENAME_CHARS).decode("ascii")
 
     # If in Windows, remove any `.lnk` extension to prevent issues with the file explorer.
     if sys.platform == "win32" and filename.lower().endswith(".lnk"):
@@ -79,6 +79,7 @@ setup(
     extras_require={
         'dragodis': ['dragodis>=0.2.0'],
         'kordesii': ['kordesii>=2.0.0'],
+        'orjson': ['orjson'],
         'testing': [
             'jsonschema',
             'dragodis',